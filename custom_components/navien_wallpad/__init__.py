@@ -1,11 +1,14 @@
 from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN, PLATFORMS, CONF_HOST, CONF_PORT
+from .const import DOMAIN, PLATFORMS, CONF_HOST, CONF_PORT, CONF_LATENCY_EVENTS
 from .gateway import NavienGateway
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    gateway = NavienGateway(hass, entry.data[CONF_HOST], entry.data[CONF_PORT])
+    gateway = NavienGateway(
+        hass, entry.data[CONF_HOST], entry.data[CONF_PORT],
+        latency_events=entry.options.get(CONF_LATENCY_EVENTS, False),
+    )
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = gateway
     
     # 1. 기기 등록(Platform) 먼저 실행 (리스너 등록)
@@ -13,9 +16,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # 2. 통신 시작 (패킷 수신)
     await gateway.start()
+
+    # 3. 옵션 변경 시 재시작
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
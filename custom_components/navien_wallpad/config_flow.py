@@ -1,12 +1,18 @@
 from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries
-from .const import DOMAIN, CONF_HOST, CONF_PORT, DEFAULT_PORT
+from homeassistant.core import callback
+from .const import DOMAIN, CONF_HOST, CONF_PORT, DEFAULT_PORT, CONF_LATENCY_EVENTS
 
 class NavienConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # 버전은 숫자여야 합니다.
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return NavienOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         errors = {}
         if user_input is not None:
@@ -27,3 +33,22 @@ class NavienConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=data_schema,
             errors=errors,
         )
+
+class NavienOptionsFlow(config_entries.OptionsFlow):
+    # HA 2024.11 이전에는 self.config_entry가 없으므로 직접 보관
+    def __init__(self, entry):
+        self._entry = entry
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        # 명령 지연시간 디버그 이벤트 (navien_wallpad_command_latency)
+        data_schema = vol.Schema({
+            vol.Optional(
+                CONF_LATENCY_EVENTS,
+                default=self._entry.options.get(CONF_LATENCY_EVENTS, False),
+            ): bool,
+        })
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
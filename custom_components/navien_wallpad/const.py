@@ -11,6 +11,9 @@ PLATFORMS = [
 
 CONF_HOST = "host"
 CONF_PORT = "port"
+CONF_LATENCY_EVENTS = "latency_events"
 DEFAULT_PORT = 8888
 
-PACKET_PREFIX = b'\xF7'
\ No newline at end of file
+PACKET_PREFIX = b'\xF7'
+
+EVENT_COMMAND_LATENCY = f"{DOMAIN}_command_latency"
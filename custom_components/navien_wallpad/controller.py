@@ -61,6 +61,13 @@ class NavienController:
             data = pkt[5:5+data_len]
         except IndexError: return
 
+        # 0. Command ACK: assumed to echo our command with the high bit set
+        #    (e.g. F7 0E 11 41 01 01 .. -> F7 0E 11 C1 ..). Unmatched ACKs are
+        #    logged at debug level by the tracer so a different format shows up.
+        if cmd & 0x80 and cmd != 0x81:
+            self.gateway.command_acked(dev_id, pkt[2], cmd)
+            return
+
         # 1. Light (0x0E)
         if dev_id == 0x0E and cmd == 0x81:
             if len(data) >= 2: 
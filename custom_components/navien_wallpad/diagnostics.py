@@ -0,0 +1,11 @@
+from __future__ import annotations
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from .const import DOMAIN
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    gateway = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "devices": sorted(gateway.devices),
+        "latency": gateway.tracer.as_dict(),
+    }
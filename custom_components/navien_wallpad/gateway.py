@@ -3,21 +3,29 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from .transport import AsyncConnection
 from .controller import NavienController
-from .const import DOMAIN
+from .tracing import LatencyTracker
+from .const import DOMAIN, EVENT_COMMAND_LATENCY
 
 class NavienGateway:
-    def __init__(self, hass: HomeAssistant, host, port):
+    def __init__(self, hass: HomeAssistant, host, port, latency_events=False):
         self.hass = hass
         self.conn = AsyncConnection(host, port)
         self.controller = NavienController(self)
         self.devices = {}
         self._reconnect_task = None
+        self.tracer = LatencyTracker(self._fire_latency_event if latency_events else None)
 
     async def start(self):
         await self.conn.open()
-        asyncio.create_task(self._loop())
+        self._reconnect_task = asyncio.create_task(self._loop())
 
     async def stop(self):
+        # 수신 루프를 먼저 종료해야 재연결하지 않음 (옵션 변경 시 reload)
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            try: await self._reconnect_task
+            except asyncio.CancelledError: pass
+            self._reconnect_task = None
         await self.conn.close()
 
     async def _loop(self):
@@ -29,11 +37,13 @@ class NavienGateway:
                 # Connection lost, wait and retry
                 await asyncio.sleep(5)
                 try: await self.conn.open()
-                except: pass
+                except Exception: pass
 
     @callback
     def update_device(self, state):
         uid = state.key.unique_id
+        prev = self.devices.get(uid)
+        self.tracer.confirm(state.key, prev.state if prev else None, state.state)
         if uid not in self.devices:
             self.devices[uid] = state
             async_dispatcher_send(self.hass, f"{DOMAIN}_new_device", state)
@@ -41,6 +51,18 @@ class NavienGateway:
             self.devices[uid] = state
             async_dispatcher_send(self.hass, f"{DOMAIN}_update_{uid}", state)
 
+    @callback
+    def command_acked(self, dev_id, sub, cmd):
+        self.tracer.ack(dev_id, sub, cmd)
+
+    @callback
+    def _fire_latency_event(self, trace):
+        self.hass.bus.async_fire(EVENT_COMMAND_LATENCY, trace.as_dict())
+
     async def send(self, key, action, **kwargs):
         pkt = self.controller.make_cmd(key.device_type, key.index, action, **kwargs)
-        await self.conn.send(pkt)
\ No newline at end of file
+        trace = self.tracer.begin(key, action)
+        if await self.conn.send(pkt):
+            self.tracer.written(trace, pkt)
+        else:
+            self.tracer.discard(trace)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+import itertools
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import DeviceKey
+
+LOGGER = logging.getLogger(__name__)
+
+RESERVOIR_SIZE = 256
+PENDING_TIMEOUT = 30.0
+PERCENTILES = (50, 90, 99)
+
+# State field each action changes (thermostat/fan states are dicts)
+ACTION_FIELDS = {
+    "temp": "target_temp",
+    "hvac": "hvac_mode",
+    "away": "preset_mode",
+    "set_speed": "percentage",
+    "on": "state",
+    "off": "state",
+}
+
+def state_changed(action: str, prev, new) -> bool:
+    if prev is None: return True
+    if isinstance(prev, dict) and isinstance(new, dict):
+        field_name = ACTION_FIELDS.get(action)
+        if field_name: return prev.get(field_name) != new.get(field_name)
+    return prev != new
+
+@dataclass
+class CommandTrace:
+    trace_id: int
+    key: DeviceKey
+    action: str
+    enqueued: float
+    match: tuple[int, int, int] | None = None  # (device id, sub id, cmd) of the sent packet
+    written: float | None = None
+    acked: float | None = None
+    confirmed: float | None = None
+
+    def as_dict(self) -> dict:
+        def rel(ts):
+            return None if ts is None else round((ts - self.enqueued) * 1000, 1)
+        return {
+            "trace_id": self.trace_id,
+            "device": self.key.unique_id,
+            "action": self.action,
+            "write_ms": rel(self.written),
+            "ack_ms": rel(self.acked),
+            "confirm_ms": rel(self.confirmed),
+        }
+
+class Reservoir:
+    """Fixed-size uniform sample of latencies (Algorithm R)."""
+
+    def __init__(self, size: int = RESERVOIR_SIZE):
+        self.size = size
+        self.count = 0
+        self.samples: list[float] = []
+
+    def add(self, value: float):
+        self.count += 1
+        if len(self.samples) < self.size:
+            self.samples.append(value)
+        else:
+            i = random.randrange(self.count)
+            if i < self.size: self.samples[i] = value
+
+    def percentiles(self) -> dict:
+        if not self.samples: return {}
+        # Nearest-rank percentile
+        ordered = sorted(self.samples)
+        n = len(ordered)
+        return {
+            f"p{p}": round(ordered[max(math.ceil(p / 100 * n) - 1, 0)] * 1000, 1)
+            for p in PERCENTILES
+        }
+
+@dataclass
+class DeviceTypeStats:
+    write: Reservoir = field(default_factory=Reservoir)
+    ack: Reservoir = field(default_factory=Reservoir)
+    confirm: Reservoir = field(default_factory=Reservoir)
+    timeouts: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "commands": self.write.count,
+            "confirmed": self.confirm.count,
+            "timeouts": self.timeouts,
+            "write_ms": self.write.percentiles(),
+            "ack_ms": self.ack.percentiles(),
+            "confirm_ms": self.confirm.percentiles(),
+        }
+
+class LatencyTracker:
+    """Tracks command -> confirmed state latency per device type."""
+
+    def __init__(self, on_complete=None):
+        self._ids = itertools.count(1)
+        self._pending: dict[int, CommandTrace] = {}
+        self._stats: dict[str, DeviceTypeStats] = {}
+        self._on_complete = on_complete
+
+    def _type_stats(self, key: DeviceKey) -> DeviceTypeStats:
+        name = key.device_type.name.lower()
+        if name not in self._stats: self._stats[name] = DeviceTypeStats()
+        return self._stats[name]
+
+    def begin(self, key: DeviceKey, action: str) -> CommandTrace:
+        self._expire()
+        trace = CommandTrace(next(self._ids), key, action, time.monotonic())
+        self._pending[trace.trace_id] = trace
+        return trace
+
+    def written(self, trace: CommandTrace, pkt: bytes):
+        trace.written = time.monotonic()
+        trace.match = (pkt[1], pkt[2], pkt[3])
+        self._type_stats(trace.key).write.add(trace.written - trace.enqueued)
+        LOGGER.debug("Trace %d: %s %s written", trace.trace_id, trace.key.unique_id, trace.action)
+
+    def discard(self, trace: CommandTrace):
+        self._pending.pop(trace.trace_id, None)
+
+    def ack(self, dev_id: int, sub: int, cmd: int):
+        # Wallpad echoes the command with the high bit set; credit the oldest match
+        self._expire()
+        now = time.monotonic()
+        for trace in self._pending.values():
+            if trace.acked is None and trace.match == (dev_id, sub, cmd & 0x7F):
+                trace.acked = now
+                self._type_stats(trace.key).ack.add(now - trace.enqueued)
+                return
+        LOGGER.debug("ACK %02X %02X %02X matched no pending command", dev_id, sub, cmd)
+
+    def confirm(self, key: DeviceKey, prev, new):
+        # A routine status poll may still carry the old state; only count frames
+        # after the ACK or frames that changed the field the command targets.
+        # One frame confirms at most the oldest eligible trace, so a quick
+        # on -> off pair is not both confirmed by the "on" frame.
+        self._expire()
+        now = time.monotonic()
+        for trace in self._pending.values():
+            if trace.key != key or trace.written is None: continue
+            if trace.acked is not None or state_changed(trace.action, prev, new):
+                break
+        else:
+            return
+        trace.confirmed = now
+        del self._pending[trace.trace_id]
+        self._type_stats(key).confirm.add(now - trace.enqueued)
+        LOGGER.debug("Trace %d: %s confirmed in %.1f ms",
+                     trace.trace_id, key.unique_id, (now - trace.enqueued) * 1000)
+        if self._on_complete: self._on_complete(trace)
+
+    def _expire(self):
+        now = time.monotonic()
+        for trace in [t for t in self._pending.values() if now - t.enqueued > PENDING_TIMEOUT]:
+            del self._pending[trace.trace_id]
+            self._type_stats(trace.key).timeouts += 1
+
+    def as_dict(self) -> dict:
+        self._expire()
+        return {
+            "pending": [t.as_dict() for t in self._pending.values()],
+            "device_types": {name: s.as_dict() for name, s in self._stats.items()},
+        }
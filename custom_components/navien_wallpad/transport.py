@@ -32,13 +32,15 @@ class AsyncConnection:
 
     async def send(self, data: bytes):
         if not self._connected or not self.writer:
-            return
+            return False
         try:
             self.writer.write(data)
             await self.writer.drain()
+            return True
         except Exception as e:
             LOGGER.error(f"Send error: {e}")
             self._connected = False
+            return False
 
     async def recv(self):
         if not self._connected or not self.reader:
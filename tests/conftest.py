@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# Make custom_components importable without installing the integration.
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
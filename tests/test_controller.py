@@ -0,0 +1,70 @@
+"""Tests for frame parsing in NavienController."""
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.navien_wallpad.controller import NavienController  # noqa: E402
+from custom_components.navien_wallpad.models import DeviceKey, DeviceType  # noqa: E402
+
+
+class StubGateway:
+    def __init__(self):
+        self.acks = []
+        self.updates = []
+
+    def command_acked(self, dev_id, sub, cmd):
+        self.acks.append((dev_id, sub, cmd))
+
+    def update_device(self, state):
+        self.updates.append(state)
+
+
+def frame(*body):
+    xor = 0
+    for b in body: xor ^= b
+    add = (sum(body) + xor) & 0xFF
+    return bytes(body + (xor, add))
+
+
+@pytest.fixture
+def gateway():
+    return StubGateway()
+
+
+@pytest.fixture
+def controller(gateway):
+    return NavienController(gateway)
+
+
+def test_ack_frame_is_reported(controller, gateway):
+    controller.feed(frame(0xF7, 0x0E, 0x11, 0xC1, 0x02, 0x01, 0x01))
+
+    assert gateway.acks == [(0x0E, 0x11, 0xC1)]
+    assert gateway.updates == []
+
+
+def test_status_frame_still_updates_devices(controller, gateway):
+    controller.feed(frame(0xF7, 0x0E, 0x1F, 0x81, 0x03, 0x00, 0x01, 0x00))
+
+    assert gateway.acks == []
+    assert [(s.key, s.state) for s in gateway.updates] == [
+        (DeviceKey(DeviceType.LIGHT, 1), True),
+        (DeviceKey(DeviceType.LIGHT, 2), False),
+    ]
+
+
+def test_ack_and_status_in_one_chunk(controller, gateway):
+    controller.feed(
+        frame(0xF7, 0x0E, 0x11, 0xC1, 0x02, 0x01, 0x01)
+        + frame(0xF7, 0x0E, 0x1F, 0x81, 0x02, 0x00, 0x01)
+    )
+
+    assert gateway.acks == [(0x0E, 0x11, 0xC1)]
+    assert [(s.key, s.state) for s in gateway.updates] == [(DeviceKey(DeviceType.LIGHT, 1), True)]
+
+
+def test_make_cmd_ack_matches_command(controller, gateway):
+    pkt = controller.make_cmd(DeviceType.LIGHT, 1, "on")
+    controller.feed(frame(0xF7, pkt[1], pkt[2], pkt[3] | 0x80, 0x02, 0x01, 0x01))
+
+    assert gateway.acks == [(pkt[1], pkt[2], pkt[3] | 0x80)]
@@ -0,0 +1,208 @@
+"""Tests for the command latency tracer (no Home Assistant runtime needed)."""
+import importlib.util
+import pathlib
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+
+import pytest
+
+# Load tracing.py directly; importing the package would pull in Home Assistant.
+_PATH = pathlib.Path(__file__).parents[1] / "custom_components" / "navien_wallpad" / "tracing.py"
+_spec = importlib.util.spec_from_file_location("navien_tracing", _PATH)
+tracing = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = tracing
+_spec.loader.exec_module(tracing)
+
+
+class DeviceType(IntEnum):
+    LIGHT = 0x0E
+    THERMOSTAT = 0x36
+
+
+@dataclass(frozen=True)
+class DeviceKey:
+    device_type: DeviceType
+    index: int
+
+    @property
+    def unique_id(self):
+        return f"{self.device_type.name.lower()}_{self.index}"
+
+
+LIGHT_1 = DeviceKey(DeviceType.LIGHT, 1)
+LIGHT_2 = DeviceKey(DeviceType.LIGHT, 2)
+LIGHT_1_ON = bytes([0xF7, 0x0E, 0x11, 0x41, 0x01, 0x01, 0x00, 0x00])
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(tracing.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def tracker(clock):
+    completed = []
+    tracker = tracing.LatencyTracker(completed.append)
+    tracker.completed = completed
+    return tracker
+
+
+def light_stats(tracker):
+    return tracker.as_dict()["device_types"]["light"]
+
+
+def test_reservoir_is_bounded(monkeypatch):
+    res = tracing.Reservoir(size=4)
+    for v in range(4):
+        res.add(v)
+    assert res.samples == [0, 1, 2, 3]
+
+    # Algorithm R: replace slot i when randrange(count) < size
+    monkeypatch.setattr(tracing.random, "randrange", lambda n: 2)
+    res.add(10)
+    monkeypatch.setattr(tracing.random, "randrange", lambda n: 4)
+    res.add(11)
+    assert res.samples == [0, 1, 10, 3]
+    assert res.count == 6
+
+
+def test_reservoir_percentiles():
+    res = tracing.Reservoir()
+    assert res.percentiles() == {}
+    for ms in range(1, 101):
+        res.add(ms / 1000)
+    assert res.percentiles() == {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+
+    single = tracing.Reservoir()
+    single.add(0.005)
+    assert single.percentiles() == {"p50": 5.0, "p90": 5.0, "p99": 5.0}
+
+
+def test_full_trace(tracker, clock):
+    trace = tracker.begin(LIGHT_1, "on")
+    clock.now += 0.01
+    tracker.written(trace, LIGHT_1_ON)
+    clock.now += 0.02
+    tracker.ack(0x0E, 0x11, 0xC1)
+    clock.now += 0.1
+    tracker.confirm(LIGHT_1, False, True)
+
+    assert tracker.completed[0].as_dict() == {
+        "trace_id": 1, "device": "light_1", "action": "on",
+        "write_ms": 10.0, "ack_ms": 30.0, "confirm_ms": 130.0,
+    }
+    stats = light_stats(tracker)
+    assert stats["commands"] == 1
+    assert stats["confirmed"] == 1
+    assert stats["confirm_ms"]["p50"] == 130.0
+    assert tracker.as_dict()["pending"] == []
+
+
+def test_ack_must_match_device_sub_and_command(tracker):
+    trace = tracker.begin(LIGHT_1, "on")
+    tracker.written(trace, LIGHT_1_ON)
+
+    tracker.ack(0x0E, 0x12, 0xC1)  # other light
+    tracker.ack(0x0E, 0x11, 0xC3)  # other command
+    tracker.ack(0x36, 0x11, 0xC1)  # other device
+    assert trace.acked is None
+
+    tracker.ack(0x0E, 0x11, 0xC1)
+    assert trace.acked is not None
+
+
+def test_unchanged_poll_before_ack_does_not_confirm(tracker):
+    trace = tracker.begin(LIGHT_1, "on")
+    tracker.written(trace, LIGHT_1_ON)
+
+    tracker.confirm(LIGHT_1, False, False)
+    tracker.confirm(LIGHT_2, False, True)
+    assert tracker.completed == []
+
+    tracker.ack(0x0E, 0x11, 0xC1)
+    tracker.confirm(LIGHT_1, False, False)
+    assert tracker.completed == [trace]
+
+
+def test_status_before_write_does_not_confirm(tracker):
+    tracker.begin(LIGHT_1, "on")
+    tracker.confirm(LIGHT_1, False, True)
+    assert tracker.completed == []
+
+
+def test_stale_trace_times_out_instead_of_confirming(tracker, clock):
+    trace = tracker.begin(LIGHT_1, "on")
+    tracker.written(trace, LIGHT_1_ON)
+
+    clock.now += tracing.PENDING_TIMEOUT + 90
+    tracker.confirm(LIGHT_1, False, True)
+
+    assert tracker.completed == []
+    stats = light_stats(tracker)
+    assert stats["timeouts"] == 1
+    assert stats["confirmed"] == 0
+    assert stats["confirm_ms"] == {}
+
+
+def test_stale_trace_is_not_acked(tracker, clock):
+    trace = tracker.begin(LIGHT_1, "on")
+    tracker.written(trace, LIGHT_1_ON)
+
+    clock.now += tracing.PENDING_TIMEOUT + 1
+    tracker.ack(0x0E, 0x11, 0xC1)
+
+    assert trace.acked is None
+    assert light_stats(tracker)["timeouts"] == 1
+
+
+def test_discarded_trace_is_forgotten(tracker, clock):
+    trace = tracker.begin(LIGHT_1, "on")
+    tracker.discard(trace)
+
+    clock.now += tracing.PENDING_TIMEOUT + 1
+    assert tracker.as_dict() == {"pending": [], "device_types": {}}
+
+
+THERMO_1 = DeviceKey(DeviceType.THERMOSTAT, 1)
+THERMO_1_TEMP = bytes([0xF7, 0x36, 0x11, 0x44, 0x01, 0x17, 0x00, 0x00])
+
+
+def thermo(current, target, mode="heat"):
+    return {"hvac_mode": mode, "preset_mode": "none", "current_temp": current, "target_temp": target}
+
+
+def test_thermostat_confirms_on_targeted_field_only(tracker):
+    trace = tracker.begin(THERMO_1, "temp")
+    tracker.written(trace, THERMO_1_TEMP)
+
+    # Room temperature moved but the setpoint is still the old one
+    tracker.confirm(THERMO_1, thermo(21.0, 20.0), thermo(21.5, 20.0))
+    tracker.confirm(THERMO_1, thermo(21.5, 20.0), thermo(21.5, 20.0, mode="off"))
+    assert tracker.completed == []
+
+    tracker.confirm(THERMO_1, thermo(21.5, 20.0), thermo(21.5, 23.0))
+    assert tracker.completed == [trace]
+
+
+def test_frame_confirms_only_oldest_trace(tracker):
+    on = tracker.begin(LIGHT_1, "on")
+    tracker.written(on, LIGHT_1_ON)
+    off = tracker.begin(LIGHT_1, "off")
+    tracker.written(off, LIGHT_1_ON[:5] + b"\x00" + LIGHT_1_ON[6:])
+
+    tracker.confirm(LIGHT_1, False, True)
+    assert tracker.completed == [on]
+
+    tracker.confirm(LIGHT_1, True, False)
+    assert tracker.completed == [on, off]